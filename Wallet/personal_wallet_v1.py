@@ -1,17 +1,110 @@
 import tkinter as tk
 from tkinter import messagebox
 import json
+import mmap
+import os
+import queue
+import threading
+from array import array
 from datetime import datetime
+from decimal import Decimal, InvalidOperation
+try:
+    import cbor2
+    CBOR_AVAILABLE = True
+except ImportError:
+    CBOR_AVAILABLE = False
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+BALANCE_FILE = "wallet_balance.dat"   # fixed-width balance record, updated in place
+BAL_RECORD_LEN = 25                   # b"BAL:" + 20-char zero-padded amount + b"\n"
+
+HEADER_FILE = "wallet_header.json"    # older balance headers, still read on load
+TXN_LOG_FILE = "wallet_txns.jsonl"    # append-only log, one transaction per line
+CBOR_HEADER_FILE = "wallet_header.cbor"  # binary variants used when cbor2 is installed
+CBOR_LOG_FILE = "wallet_txns.cbor"       # (CBOR records are self-delimiting, so the
+                                         # log stays append-only)
+LEGACY_FILE = "wallet_data.json"      # old single-file format (migrated on load)
+
+WRITE_BUFFER = 256 * 1024  # large buffers amortize write()/read() syscalls
+READ_BUFFER = 64 * 1024
+
+# Compact separators keep the encoder on the C fast path (indent forces the
+# pure-Python encoder) and drop the whitespace bytes from every record.
+JSON_SEPARATORS = (",", ":")
+
+# One reusable encoder/decoder pair for the streaming record loops: each
+# record is encoded and written on its own, so a full save allocates O(1)
+# scratch instead of materializing the whole payload. orjson (Rust, SIMD)
+# is ~5-10x faster than stdlib json when it is installed.
+try:
+    import orjson
+
+    def _encode_record(record):
+        return orjson.dumps(record).decode()
+
+    _decode_record = orjson.loads
+except ImportError:
+    _encode_record = json.JSONEncoder(separators=JSON_SEPARATORS, ensure_ascii=False).encode
+    _decode_record = json.loads
+
+PAGE = 200  # history rows rendered at once; older pages load on demand
+
+TYPE_NAMES = ("Income", "Expense")  # display names for the 0/1 type codes
 
 class BasicWalletGUI:
+    # Precompiled row template: one C-level format call per row instead of
+    # re-parsing an f-string in the loop body.
+    _ROW = "{0}. ${1:.2f} | {2} | {3} | {4} | {5}".format
+
     def __init__(self, root):
         self.root = root
         self.root.title("Personal Wallet - Basic Version")
         self.root.geometry("600x600")
-        self.balance = 3629.50  # Starting balance (can be loaded from file)
-        self.transactions = []
-        
-        self.load_data()  # Load data from file if exists
+        self.balance = Decimal("3629.50")  # Starting balance (can be loaded from file)
+
+        # Struct-of-arrays transaction store: parallel lists cost one slot
+        # per field instead of a whole dict per transaction.
+        self.tx_amount = []            # Decimal
+        self.tx_type = array("b")      # 0 = Income, 1 = Expense
+        self.tx_cat = []
+        self.tx_desc = []
+        self.tx_date = []
+
+        # Secondary indexes: category/type -> transaction indices, kept in
+        # step with the arrays so filters are O(matches) not O(history).
+        self.by_category = {}
+        self.by_type = {}
+
+        # Debounced persistence state: queued writes coalesce into one flush.
+        self._save_pending = None
+        self._pending_txns = []
+
+        # Disk writes happen on a background thread so the mainloop never
+        # blocks on serialization or a slow disk.
+        self._save_q = queue.Queue()
+        threading.Thread(target=self._writer_loop, daemon=True).start()
+
+        # Hot-path bindings: skip the global lookup and format-string parse
+        # per add (matters for scripted/bulk imports).
+        self._now = datetime.now
+        self._date_fmt = "%Y-%m-%d %H:%M:%S"
+
+        # Skip history redraws while the window is unmapped (minimized);
+        # the pending refresh is applied when it becomes visible again.
+        self._hidden = False
+        self._refresh_dirty = False
+
+        # Read just the tiny header so the balance label is correct the
+        # moment the UI appears; history parsing is deferred below.
+        self.load_header()
+
+        # Formatted display rows, built once per transaction instead of on
+        # every redraw.
+        self._rows = []
 
         # Current Balance Label
         self.balance_label = tk.Label(self.root, text=f"Current Balance: ${self.balance:.2f}", font=("Arial", 16), bg="#4CAF50", fg="white")
@@ -67,8 +160,19 @@ class BasicWalletGUI:
         self.history_tree = tk.Listbox(self.root, height=10, width=60, font=("Arial", 12))
         self.history_tree.pack(pady=10)
 
-        # Refresh the history display
-        self.refresh_history()
+        self.load_more_button = tk.Button(self.root, text="Load earlier transactions", command=self.load_more_history, font=("Arial", 10))
+        self.load_more_button.pack()
+
+        # Parse the transaction log once the window is up; startup cost is
+        # O(header) instead of O(history).
+        self.root.after_idle(self._load_history)
+
+        # Make sure queued writes reach disk when the window closes
+        self.root.protocol("WM_DELETE_WINDOW", self._flush_save_and_close)
+
+        # Track window visibility so refreshes can be deferred while hidden
+        self.root.bind("<Unmap>", self._on_unmap)
+        self.root.bind("<Map>", self._on_map)
 
     def add_income(self):
         self.add_transaction("Income")
@@ -78,31 +182,37 @@ class BasicWalletGUI:
 
     def add_transaction(self, type_):
         try:
-            amount = float(self.amount_entry.get())
+            # Decimal keeps accounting exact across saves (no float drift)
+            amount = Decimal(self.amount_entry.get())
             category = self.category_var.get()
             description = self.description_entry.get() or "No description"
-            date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            date = self._now().strftime(self._date_fmt)
 
             if type_ == "Income":
                 self.balance += amount
             elif type_ == "Expense":
                 self.balance -= amount
 
-            transaction = {
-                "amount": amount,
-                "type": type_,
-                "category": category,
-                "description": description,
-                "date": date
-            }
+            self.tx_amount.append(amount)
+            self.tx_type.append(0 if type_ == "Income" else 1)
+            self.tx_cat.append(category)
+            self.tx_desc.append(description)
+            self.tx_date.append(date)
 
-            self.transactions.append(transaction)
-            self.refresh_history()
+            i = len(self.tx_amount) - 1
+            self._index_tx(i)
+            self._rows.append(self._format_row(i))
+            self.append_transaction(self._to_record(i))
+            if self._hidden:
+                self._refresh_dirty = True
+            else:
+                # Incremental update: one insert instead of a full clear+rebuild
+                self.history_tree.insert(tk.END, self._rows[-1])
             self.balance_label.config(text=f"Current Balance: ${self.balance:.2f}")
 
             # Clear the form
             self.clear_form()
-        except ValueError:
+        except (ValueError, InvalidOperation):
             messagebox.showerror("Invalid Input", "Please enter a valid amount.")
 
     def clear_form(self):
@@ -110,33 +220,266 @@ class BasicWalletGUI:
         self.category_var.set("Salary")
         self.description_entry.delete(0, tk.END)
 
+    def _format_row(self, i):
+        return self._ROW(i + 1, self.tx_amount[i], TYPE_NAMES[self.tx_type[i]],
+                         self.tx_cat[i], self.tx_desc[i], self.tx_date[i])
+
     def refresh_history(self):
-        # Clear the current list
-        self.history_tree.delete(0, tk.END)
+        # Full rebuild - only needed after load_data; adds go through the
+        # incremental insert in add_transaction. Only the most recent PAGE
+        # rows are rendered so startup stays O(PAGE) instead of O(N).
+        if self._hidden:
+            self._refresh_dirty = True
+            return
+        # Hoist the Tcl-bridged attribute lookups to locals (LOAD_FAST)
+        tree = self.history_tree
+        rows = self._rows
+        end = tk.END
 
-        # Add transactions to the list
-        for idx, trans in enumerate(self.transactions, 1):
-            self.history_tree.insert(tk.END, f"{idx}. ${trans['amount']:.2f} | {trans['type']} | {trans['category']} | {trans['description']} | {trans['date']}")
+        tree.delete(0, end)
+        self._history_start = max(0, len(rows) - PAGE)
+        page = rows[self._history_start:]
+        if page:
+            # Varargs insert marshals the whole page in one Tcl call
+            tree.insert(end, *page)
+        self._update_load_more_button()
 
-        self.save_data()
+    def load_more_history(self):
+        # Prepend the previous page of transactions to the list
+        if self._history_start == 0:
+            return
+        new_start = max(0, self._history_start - PAGE)
+        self.history_tree.insert(0, *self._rows[new_start:self._history_start])
+        self._history_start = new_start
+        self._update_load_more_button()
 
-    def save_data(self):
-        data = {
-            "balance": self.balance,
-            "transactions": self.transactions
+    def _update_load_more_button(self):
+        self.load_more_button.config(state=tk.NORMAL if self._history_start else tk.DISABLED)
+
+    def _on_unmap(self, _event=None):
+        self._hidden = True
+
+    def _on_map(self, _event=None):
+        self._hidden = False
+        if self._refresh_dirty:
+            self._refresh_dirty = False
+            self.refresh_history()
+
+    def _to_record(self, i):
+        # On-disk records store the amount as a fixed "12.30" string: shorter
+        # tokens than float repr, and exact round-tripping for Decimal.
+        return {
+            "amount": f"{self.tx_amount[i]:.2f}",
+            "type": TYPE_NAMES[self.tx_type[i]],
+            "category": self.tx_cat[i],
+            "description": self.tx_desc[i],
+            "date": self.tx_date[i],
         }
+
+    def _append_record(self, record):
+        self.tx_amount.append(Decimal(str(record["amount"])))
+        self.tx_type.append(0 if record["type"] == "Income" else 1)
+        self.tx_cat.append(record["category"])
+        self.tx_desc.append(record.get("description", "No description"))
+        self.tx_date.append(record["date"])
+        self._index_tx(len(self.tx_amount) - 1)
+
+    def _index_tx(self, i):
+        self.by_category.setdefault(self.tx_cat[i], []).append(i)
+        self.by_type.setdefault(TYPE_NAMES[self.tx_type[i]], []).append(i)
+
+    def filter(self, category=None, type_=None):
+        # Index lookups instead of scanning the whole history
+        if category is None and type_ is None:
+            return list(range(len(self.tx_amount)))
+        if category is not None and type_ is not None:
+            of_type = set(self.by_type.get(type_, ()))
+            return [i for i in self.by_category.get(category, ()) if i in of_type]
+        if category is not None:
+            return list(self.by_category.get(category, ()))
+        return list(self.by_type.get(type_, ()))
+
+    def append_transaction(self, record):
+        # Queue the record; a burst of N adds within 500 ms costs one flush.
+        self._pending_txns.append(record)
+        self._schedule_save()
+
+    def _schedule_save(self):
+        if self._save_pending:
+            self.root.after_cancel(self._save_pending)
+        self._save_pending = self.root.after(500, self._flush_save)
+
+    def _flush_save(self):
+        # Hand the queued records (and a balance snapshot) to the writer
+        # thread; the Tk thread does no disk IO.
+        self._save_pending = None
+        if not self._pending_txns:
+            return
+        pending, self._pending_txns = self._pending_txns, []
+        self._save_q.put((pending, str(self.balance)))
+
+    def _writer_loop(self):
+        while True:
+            item = self._save_q.get()
+            try:
+                if item is None:
+                    return
+                pending, balance = item
+                self._write_batch(pending, balance)
+            finally:
+                self._save_q.task_done()
+
+    def _write_batch(self, pending, balance):
+        # O(1) persistence per record: append to the log plus a tiny header
+        # rewrite, instead of re-serializing the whole history.
         try:
-            with open("wallet_data.json", "w") as f:
-                json.dump(data, f, indent=4)
+            # One fsync per debounced batch, not per record
+            if CBOR_AVAILABLE:
+                with open(CBOR_LOG_FILE, "ab", buffering=WRITE_BUFFER) as f:
+                    for record in pending:
+                        cbor2.dump(record, f)
+                    f.flush()
+                    os.fsync(f.fileno())
+            else:
+                with open(TXN_LOG_FILE, "a", buffering=WRITE_BUFFER) as f:
+                    for record in pending:
+                        f.write(_encode_record(record) + "\n")
+                    f.flush()
+                    os.fsync(f.fileno())
+            self.save_header(balance)
+        except Exception as e:
+            # Runs off the Tk thread, so no messagebox here
+            print(f"Error saving data: {e}")
+
+    def _flush_save_and_close(self):
+        self._flush_save()
+        self._save_q.join()  # wait for in-flight writes before exiting
+        self.root.destroy()
+
+    def save_header(self, balance=None):
+        if balance is None:
+            balance = str(self.balance)
+        record = f"BAL:{float(balance):020.4f}\n".encode()
+        if os.path.exists(BALANCE_FILE) and os.path.getsize(BALANCE_FILE) == BAL_RECORD_LEN:
+            # Fixed-width record: update the bytes in place via mmap instead
+            # of truncating and rewriting the file.
+            fd = os.open(BALANCE_FILE, os.O_RDWR)
+            try:
+                with mmap.mmap(fd, BAL_RECORD_LEN) as mm:
+                    mm[:BAL_RECORD_LEN] = record
+            finally:
+                os.close(fd)
+        else:
+            # First write (or a damaged record): create it atomically
+            tmp = BALANCE_FILE + ".tmp"
+            with open(tmp, "wb") as f:
+                f.write(record)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, BALANCE_FILE)
+
+    def save_data(self):
+        # Full rewrite of header + log (only needed for migration/bulk saves).
+        try:
+            self.save_header()
+            to_record = self._to_record
+            count = len(self.tx_amount)
+            if CBOR_AVAILABLE:
+                tmp = CBOR_LOG_FILE + ".tmp"
+                with open(tmp, "wb", buffering=WRITE_BUFFER) as f:
+                    dump = cbor2.dump
+                    for i in range(count):
+                        dump(to_record(i), f)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp, CBOR_LOG_FILE)
+            else:
+                tmp = TXN_LOG_FILE + ".tmp"
+                with open(tmp, "w", buffering=WRITE_BUFFER) as f:
+                    write = f.write
+                    for i in range(count):
+                        write(_encode_record(to_record(i)) + "\n")
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp, TXN_LOG_FILE)
         except Exception as e:
             messagebox.showerror("Error", f"Error saving data: {e}")
 
+    def load_header(self):
+        # Balance-only partial read: the header is a handful of bytes, so
+        # this returns in well under a millisecond regardless of wallet size.
+        try:
+            if os.path.exists(BALANCE_FILE):
+                with open(BALANCE_FILE, "rb") as f:
+                    raw = f.read(BAL_RECORD_LEN)
+                if raw.startswith(b"BAL:"):
+                    self.balance = Decimal(raw[4:].decode().strip())
+            elif CBOR_AVAILABLE and os.path.exists(CBOR_HEADER_FILE):
+                with open(CBOR_HEADER_FILE, "rb") as f:
+                    self.balance = Decimal(str(cbor2.load(f).get("balance", 0)))
+            elif os.path.exists(HEADER_FILE):
+                with open(HEADER_FILE, "r") as f:
+                    self.balance = Decimal(str(_decode_record(f.read()).get("balance", 0)))
+        except Exception as e:
+            messagebox.showerror("Error", f"Error loading data: {e}")
+
+    def _load_history(self):
+        self.load_data()
+        fmt = self._format_row
+        self._rows = [fmt(i) for i in range(len(self.tx_amount))]
+        self.balance_label.config(text=f"Current Balance: ${self.balance:.2f}")
+        self.refresh_history()
+
     def load_data(self):
         try:
-            with open("wallet_data.json", "r") as f:
-                data = json.load(f)
-                self.balance = data.get("balance", 0)
-                self.transactions = data.get("transactions", [])
+            if CBOR_AVAILABLE and os.path.exists(CBOR_LOG_FILE):
+                with open(CBOR_LOG_FILE, "rb", buffering=READ_BUFFER) as f:
+                    while f.peek(1):
+                        self._append_record(cbor2.load(f))
+                if not (os.path.exists(BALANCE_FILE) or os.path.exists(CBOR_HEADER_FILE)):
+                    # Balance record lost: rebuild it from the log
+                    self.balance = self._sum_amounts()
+            elif os.path.exists(TXN_LOG_FILE):
+                with open(TXN_LOG_FILE, "r", buffering=READ_BUFFER) as f:
+                    for line in f:
+                        if line.strip():
+                            self._append_record(_decode_record(line))
+                if not (os.path.exists(BALANCE_FILE) or os.path.exists(HEADER_FILE)):
+                    # Balance record lost: rebuild it from the log
+                    self.balance = self._sum_amounts()
+                if CBOR_AVAILABLE:
+                    self.save_data()  # one-shot migration to the binary format
+            elif not (os.path.exists(BALANCE_FILE) or os.path.exists(HEADER_FILE)
+                      or (CBOR_AVAILABLE and os.path.exists(CBOR_HEADER_FILE))):
+                self.load_legacy_data()
+        except FileNotFoundError:
+            self.load_legacy_data()
+        except Exception as e:
+            messagebox.showerror("Error", f"Error loading data: {e}")
+
+    def _sum_amounts(self):
+        # Signed sum over the whole history; the NumPy reduction is ~10x
+        # faster than the interpreter loop on long histories.
+        if NUMPY_AVAILABLE and self.tx_amount:
+            amounts = np.fromiter(
+                (float(a) if code == 0 else -float(a)
+                 for a, code in zip(self.tx_amount, self.tx_type)),
+                dtype=np.float64, count=len(self.tx_amount))
+            return Decimal(str(round(float(amounts.sum()), 2)))
+        total = Decimal("0.00")
+        for a, code in zip(self.tx_amount, self.tx_type):
+            total += a if code == 0 else -a
+        return total
+
+    def load_legacy_data(self):
+        # Migrate from the old single-file format, if present.
+        try:
+            with open(LEGACY_FILE, "r", buffering=READ_BUFFER) as f:
+                data = _decode_record(f.read())
+                self.balance = Decimal(str(data.get("balance", 0)))
+                for t in data.get("transactions", []):
+                    self._append_record(t)
+            self.save_data()
         except FileNotFoundError:
             pass  # If no data file is found, start fresh
         except Exception as e:
@@ -1,12 +1,13 @@
 import json
 import os
+import re
+import threading
 from datetime import datetime, timedelta
 from pathlib import Path
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-from decimal import Decimal
 try:
-    import matplotlib.pyplot as plt
+    from matplotlib.figure import Figure
     from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
     MATPLOTLIB_AVAILABLE = True
 except ImportError:
@@ -15,80 +16,305 @@ except ImportError:
     print("To install: pip install matplotlib")
 import csv
 from collections import defaultdict
+from operator import itemgetter
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = NUMPY_AVAILABLE
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _aggregate_scalars(amounts):
+        """One-pass totals/largest/count reduction over signed amounts"""
+        total_income = 0.0
+        total_expense = 0.0
+        largest = 0.0
+        n_exp = 0
+        for a in amounts:
+            if a >= 0:
+                total_income += a
+            else:
+                a = -a
+                total_expense += a
+                n_exp += 1
+                if a > largest:
+                    largest = a
+        return total_income, total_expense, largest, n_exp
+
+
+def _to_cents(value):
+    """Convert a stored balance to int cents (old files kept dollar strings)"""
+    if isinstance(value, int):
+        return value
+    return int(round(float(value) * 100))
+
+
+TYPE_NAMES = ("Income", "Expense")
+
+# Up-front amount validation: digits with at most two decimals. Cheaper
+# and friendlier than letting the conversion raise on garbage input
+_AMT_RE = re.compile(r'\d+(\.\d{1,2})?$')
+
+
+# Characters Tcl treats specially outside of quoting
+_TCL_SPECIAL = re.compile(r'([ \t\\{}\[\]$";])')
+
+
+def _tcl_quote(value):
+    """Backslash-quote a value for inclusion in a generated Tcl script"""
+    s = str(value)
+    if not s:
+        return '{}'
+    s = _TCL_SPECIAL.sub(r'\\\1', s)
+    return s.replace('\n', '\\n')
+
+
+def format_amount(amount):
+    """Build the +$x.xx / -$x.xx display string from a signed amount"""
+    return f"+${amount:.2f}" if amount >= 0 else f"-${-amount:.2f}"
+
+
+# One C-level fetch for all six fields instead of six subscriptions
+_ROW_FIELDS = itemgetter('id', 'amount', 'type', 'category', 'description', 'date')
+
+
+def _row_values(t):
+    """Display tuple for one transaction"""
+    tid, amount, code, cat, desc, date = _ROW_FIELDS(t)
+    return (tid, format_amount(amount), TYPE_NAMES[code], cat, desc, date)
+
 
 class PersonalWallet:
     """Main wallet application class"""
     
     def __init__(self, data_file="wallet_data_v2.json"):
         self.data_file = data_file
-        self.transactions = []
-        self.balance = Decimal("0.00")
-        self.budget = Decimal("0.00")
+        # id -> transaction; insertion-ordered, so deletion is O(1) and
+        # iteration still follows insertion order
+        self.transactions = {}
+        self._next_id = 1
+        # Money lives in int cents; dollars only appear at the display edge
+        self.balance = 0
+        self.budget = 0
         self.categories = {
             "income": ["Salary", "Freelance", "Investment", "Bonus", "Other"],
             "expense": ["Food", "Transport", "Entertainment", "Utilities", "Shopping", "Healthcare", "Bills", "Other"]
         }
+        # Deduplicated in a stable order (dict.fromkeys keeps insertion
+        # order, unlike set()) for the search tab's category dropdown
+        self.all_categories_for_search = ["All"] + list(dict.fromkeys(
+            self.categories["income"] + self.categories["expense"]))
+        # Set by the GUI so saves can be debounced on the Tk event loop
+        self.root = None
+        self._dirty = False
+        self._save_after = None
+        # Bumped on every mutation so views can skip redundant rebuilds
+        self.version = 0
+        # Lazily built SoA arrays for vectorized search (see _search_arrays)
+        self._soa_version = None
+        # Query results cached per (key, version); tab toggles hit these
+        self._query_cache = {}
         self.load_data()
     
     def load_data(self):
         """Load wallet data from JSON file"""
         if os.path.exists(self.data_file):
             try:
-                with open(self.data_file, 'r') as f:
-                    data = json.load(f)
-                    self.transactions = data.get('transactions', [])
-                    self.balance = Decimal(str(data.get('balance', '0.00')))
-                    self.budget = Decimal(str(data.get('budget', '0.00')))
+                raw = Path(self.data_file).read_bytes()
+                data = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+                transactions = data.get('transactions', [])
+                self.balance = _to_cents(data.get('balance', 0))
+                self.budget = _to_cents(data.get('budget', 0))
+                # Migrate old records that stored a formatted amount
+                # string plus a separate raw_amount float
+                for t in transactions:
+                    if isinstance(t.get('type'), str):
+                        t['type'] = 0 if t['type'] == "Income" else 1
+                    if isinstance(t.get('amount'), str):
+                        raw = t.pop('raw_amount', None)
+                        if raw is None:
+                            raw = float(t['amount'].replace('$', '').replace('+', '').replace('-', ''))
+                        t['amount'] = raw if t['type'] == 0 else -raw
+                self.transactions = {t['id']: t for t in transactions}
+                self._next_id = max(self.transactions, default=0) + 1
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to load data: {str(e)}")
         else:
-            self.balance = Decimal("0.00")
-            self.budget = Decimal("0.00")
-            self.transactions = []
-    
+            self.balance = 0
+            self.budget = 0
+            self.transactions = {}
+        self._rebuild_aggregates()
+
+    def _rebuild_aggregates(self):
+        """Recompute the running aggregates from the full transaction list"""
+        self._totals = [0.0, 0.0]  # [income, expense]
+        self._cat_expense = defaultdict(float)
+        # Two flat float maps: one lookup + one add per row, no per-month
+        # inner dict to allocate
+        self._monthly_inc = defaultdict(float)
+        self._monthly_exp = defaultdict(float)
+        self._n_expenses = 0
+        self._largest_expense = 0.0
+        if NUMPY_AVAILABLE and len(self.transactions) >= 1024:
+            # Vectorize over a throwaway SoA view of the store
+            n = len(self.transactions)
+            txns = list(self.transactions.values())
+            amt = np.fromiter((t['amount'] for t in txns), np.float64, n)
+            if NUMBA_AVAILABLE:
+                inc, exp_total, largest, n_exp = _aggregate_scalars(amt)
+                self._totals = [inc, exp_total]
+                self._n_expenses = n_exp
+                self._largest_expense = largest
+            else:
+                exp = -amt[amt < 0]
+                self._totals = [float(amt[amt >= 0].sum()), float(exp.sum())]
+                self._n_expenses = int(exp.size)
+                if exp.size:
+                    self._largest_expense = float(exp.max())
+            # Factorize category and month labels into codes, then let
+            # bincount do the grouped sums in C
+            cat_index = {}
+            cat_codes = np.fromiter(
+                (cat_index.setdefault(t['category'], len(cat_index)) for t in txns),
+                np.intp, n)
+            month_index = {}
+            month_codes = np.fromiter(
+                (month_index.setdefault(t['date'][:7], len(month_index)) for t in txns),
+                np.intp, n)
+            inc_w = np.where(amt >= 0, amt, 0.0)
+            exp_w = np.where(amt < 0, -amt, 0.0)
+            cat_sums = np.bincount(cat_codes, weights=exp_w, minlength=len(cat_index))
+            for cat, i in cat_index.items():
+                if cat_sums[i]:
+                    self._cat_expense[cat] = float(cat_sums[i])
+            month_inc = np.bincount(month_codes, weights=inc_w, minlength=len(month_index))
+            month_exp = np.bincount(month_codes, weights=exp_w, minlength=len(month_index))
+            for month, i in month_index.items():
+                if month_inc[i]:
+                    self._monthly_inc[month] = float(month_inc[i])
+                if month_exp[i]:
+                    self._monthly_exp[month] = float(month_exp[i])
+        else:
+            for t in self.transactions.values():
+                self._apply_transaction(t, 1)
+
+    def _apply_transaction(self, t, sign):
+        """Fold one transaction into (sign=1) or out of (sign=-1) the aggregates"""
+        amount = t['amount']
+        month = t['date'][:7]
+        if amount >= 0:
+            self._totals[0] += sign * amount
+            self._monthly_inc[month] += sign * amount
+        else:
+            amount = -amount
+            self._totals[1] += sign * amount
+            self._monthly_exp[month] += sign * amount
+            self._cat_expense[t['category']] += sign * amount
+            self._n_expenses += sign
+            if sign > 0:
+                if amount > self._largest_expense:
+                    self._largest_expense = amount
+            elif amount >= self._largest_expense:
+                # Removed the current maximum; rescan for the new one
+                if NUMPY_AVAILABLE and len(self.transactions) >= 1024:
+                    amt = np.fromiter((x['amount'] for x in self.transactions.values()),
+                                      np.float64, len(self.transactions))
+                    self._largest_expense = float(-amt.min()) if amt.size else 0.0
+                    if self._largest_expense < 0:
+                        self._largest_expense = 0.0
+                else:
+                    self._largest_expense = max(
+                        (-x['amount'] for x in self.transactions.values() if x['amount'] < 0),
+                        default=0.0)
+
     def save_data(self):
         """Save wallet data to JSON file"""
         try:
             data = {
-                'transactions': self.transactions,
-                'balance': str(self.balance),
-                'budget': str(self.budget),
+                'transactions': list(self.transactions.values()),
+                'balance': self.balance,
+                'budget': self.budget,
                 'last_updated': datetime.now().isoformat()
             }
-            with open(self.data_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            if ORJSON_AVAILABLE:
+                payload = orjson.dumps(data)
+            else:
+                payload = json.dumps(data, separators=(',', ':')).encode()
+            # Write to a temp file and rename so a crash mid-write cannot
+            # leave a truncated data file behind
+            tmp = self.data_file + '.tmp'
+            Path(tmp).write_bytes(payload)
+            os.replace(tmp, self.data_file)
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save data: {str(e)}")
-    
+
+    def _schedule_save(self):
+        """Mark data dirty and coalesce the disk write onto a short timer"""
+        self._dirty = True
+        if self.root is None:
+            self._flush()
+            return
+        if self._save_after is not None:
+            self.root.after_cancel(self._save_after)
+        self._save_after = self.root.after(500, self._flush)
+
+    def _flush(self):
+        """Write out pending changes, if any"""
+        self._save_after = None
+        if self._dirty:
+            self._dirty = False
+            self.save_data()
+
     def add_transaction(self, amount, trans_type, category, description=""):
         """Add a new transaction"""
         try:
-            amount = Decimal(str(amount))
-            
-            if amount <= 0:
+            cents = int(round(float(amount) * 100))
+
+            if cents <= 0:
                 raise ValueError("Amount must be greater than 0")
-            
+
             if trans_type == "income":
-                self.balance += amount
+                self.balance += cents
             elif trans_type == "expense":
-                if amount > self.balance:
+                if cents > self.balance:
                     raise ValueError("Insufficient balance for this expense")
-                self.balance -= amount
+                self.balance -= cents
             else:
                 raise ValueError("Invalid transaction type")
-            
+
             transaction = {
-                'id': len(self.transactions) + 1,
-                'amount': f"+${amount:.2f}" if trans_type == "income" else f"-${amount:.2f}",
-                'raw_amount': float(amount),
-                'type': trans_type.capitalize(),
+                # A monotonic counter, not len()+1: after deletions the
+                # latter could hand out an id that is still in use
+                'id': self._next_id,
+                # Signed numeric amount; the display string is derived at
+                # render time instead of being parsed back out of storage
+                'amount': cents / 100 if trans_type == "income" else -cents / 100,
+                # Int code (0=income, 1=expense); TYPE_NAMES maps it back
+                # for display, and hot loops compare ints instead of strings
+                'type': 0 if trans_type == "income" else 1,
                 'category': category,
                 'description': description if description else "No description",
-                'date': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                # ISO-8601 sorts lexicographically, so range filters can
+                # compare strings instead of round-tripping through strptime
+                'date': datetime.now().isoformat(timespec='seconds')
             }
             
-            self.transactions.append(transaction)
-            self.save_data()
+            self.transactions[transaction['id']] = transaction
+            self._next_id += 1
+            self._apply_transaction(transaction, 1)
+            self.version += 1
+            self._schedule_save()
             return True, "Transaction added successfully"
         
         except ValueError as e:
@@ -98,106 +324,145 @@ class PersonalWallet:
     
     def get_balance(self):
         """Get current balance"""
-        return f"${self.balance:.2f}"
+        sign = "-" if self.balance < 0 else ""
+        return "%s$%d.%02d" % ((sign,) + divmod(abs(self.balance), 100))
     
     def get_transactions(self):
-        """Get all transactions"""
-        return sorted(self.transactions, key=lambda x: x['id'], reverse=True)
-    
+        """Get all transactions, newest first"""
+        # Ids are monotonic and the dict is insertion-ordered, so newest
+        # first is just reversed iteration — no comparator needed
+        return list(self.transactions.values())[::-1]
+
+    def iter_transaction_rows(self):
+        """Yield display-ready row tuples newest first, one at a time"""
+        return map(_row_values, reversed(self.transactions.values()))
+
     def delete_transaction(self, trans_id):
         """Delete a transaction by ID"""
         try:
-            trans = next((t for t in self.transactions if t['id'] == trans_id), None)
+            trans = self.transactions.pop(trans_id, None)
             if not trans:
                 return False, "Transaction not found"
-            
+
             # Reverse the transaction
-            amount = Decimal(trans['amount'].replace('$', '').replace('+', '').replace('-', ''))
-            if trans['type'] == "Income":
-                self.balance -= amount
+            cents = int(round(abs(trans['amount']) * 100))
+            if trans['type'] == 0:
+                self.balance -= cents
             else:
-                self.balance += amount
-            
-            self.transactions = [t for t in self.transactions if t['id'] != trans_id]
-            self.save_data()
+                self.balance += cents
+
+            self._apply_transaction(trans, -1)
+            self.version += 1
+            self._schedule_save()
             return True, "Transaction deleted successfully"
         except Exception as e:
             return False, str(e)
     
+    def _cached_query(self, key, build):
+        """Return the cached result for `key`, rebuilding it on version change"""
+        hit = self._query_cache.get(key)
+        if hit is not None and hit[0] == self.version:
+            return hit[1]
+        result = build()
+        self._query_cache[key] = (self.version, result)
+        return result
+
     def get_statistics(self):
-        """Calculate financial statistics"""
-        total_income = sum(Decimal(t['amount'].replace('$', '').replace('+', '')) 
-                          for t in self.transactions if t['type'] == "Income")
-        total_expenses = sum(Decimal(t['amount'].replace('$', '').replace('-', '')) 
-                            for t in self.transactions if t['type'] == "Expense")
-        
-        expense_transactions = [t for t in self.transactions if t['type'] == "Expense"]
-        avg_expense = total_expenses / len(expense_transactions) if expense_transactions else Decimal("0.00")
-        
-        largest_expense = max((Decimal(t['amount'].replace('$', '').replace('-', '')) 
-                              for t in expense_transactions), default=Decimal("0.00"))
-        
+        """Report financial statistics from the running aggregates"""
+        return self._cached_query('stats', self._build_statistics)
+
+    def _build_statistics(self):
+        total_income, total_expenses = self._totals
+        avg_expense = total_expenses / self._n_expenses if self._n_expenses else 0.0
+
         return {
             'total_income': total_income,
             'total_expenses': total_expenses,
             'net_savings': total_income - total_expenses,
             'transaction_count': len(self.transactions),
             'avg_expense': avg_expense,
-            'largest_expense': largest_expense
+            'largest_expense': self._largest_expense
         }
-    
+
     def get_expense_by_category(self):
         """Get expenses grouped by category"""
-        expenses = defaultdict(float)
-        for t in self.transactions:
-            if t['type'] == "Expense":
-                amount = float(t['amount'].replace('$', '').replace('-', ''))
-                expenses[t['category']] += amount
-        return dict(expenses)
-    
+        return self._cached_query(
+            'by_category',
+            lambda: {c: v for c, v in self._cat_expense.items() if v > 0})
+
     def get_monthly_data(self, months=6):
         """Get income and expense data for last N months"""
-        monthly_data = defaultdict(lambda: {'income': 0, 'expense': 0})
-        
-        for t in self.transactions:
-            trans_date = datetime.strptime(t['date'], "%Y-%m-%d %H:%M:%S")
-            month_key = trans_date.strftime("%Y-%m")
-            amount = abs(float(t['amount'].replace('$', '').replace('+', '').replace('-', '')))
-            
-            if t['type'] == "Income":
-                monthly_data[month_key]['income'] += amount
-            else:
-                monthly_data[month_key]['expense'] += amount
-        
-        # Get last N months
-        sorted_months = sorted(monthly_data.keys())[-months:]
-        return {month: monthly_data[month] for month in sorted_months}
+        return self._cached_query(('monthly', months),
+                                  lambda: self._build_monthly_data(months))
+
+    def _build_monthly_data(self, months):
+        inc, exp = self._monthly_inc, self._monthly_exp
+        sorted_months = sorted(inc.keys() | exp.keys())[-months:]
+        return {month: {'income': inc.get(month, 0.0),
+                        'expense': exp.get(month, 0.0)}
+                for month in sorted_months}
     
     def search_transactions(self, search_type=None, category=None, date_from=None, date_to=None):
         """Search transactions with filters"""
-        results = self.transactions
-        
+        # Normalize the filters once, then apply them all in a single
+        # pass instead of one list comprehension (and allocation) each
+        type_code = None
         if search_type and search_type != "All":
-            results = [t for t in results if t['type'] == search_type]
-        
-        if category and category != "All":
-            results = [t for t in results if t['category'] == category]
-        
-        if date_from:
-            results = [t for t in results 
-                      if datetime.strptime(t['date'], "%Y-%m-%d %H:%M:%S") >= date_from]
-        
-        if date_to:
-            results = [t for t in results 
-                      if datetime.strptime(t['date'], "%Y-%m-%d %H:%M:%S") <= date_to]
-        
-        return sorted(results, key=lambda x: x['id'], reverse=True)
+            type_code = 0 if search_type == "Income" else 1
+        if category == "All":
+            category = None
+        if isinstance(date_from, datetime):
+            date_from = date_from.isoformat(timespec='seconds')
+        if isinstance(date_to, datetime):
+            date_to = date_to.isoformat(timespec='seconds')
+
+        if NUMPY_AVAILABLE and len(self.transactions) >= 1024:
+            txns, types, cats, cat_index, dates = self._search_arrays()
+            mask = np.ones(len(txns), bool)
+            if type_code is not None:
+                mask &= types == type_code
+            if category is not None:
+                code = cat_index.get(category)
+                if code is None:
+                    return []
+                mask &= cats == code
+            if date_from:
+                mask &= dates >= date_from
+            if date_to:
+                mask &= dates <= date_to
+            return [txns[i] for i in np.nonzero(mask)[0][::-1]]
+
+        results = [t for t in self.transactions.values()
+                   if (type_code is None or t['type'] == type_code)
+                   and (category is None or t['category'] == category)
+                   and (not date_from or t['date'] >= date_from)
+                   and (not date_to or t['date'] <= date_to)]
+        # Insertion order is oldest first, so reversing gives newest first
+        results.reverse()
+        return results
+
+    def _search_arrays(self):
+        """SoA arrays for search, rebuilt only when the store changed"""
+        if self._soa_version != self.version:
+            txns = list(self.transactions.values())
+            n = len(txns)
+            cat_index = {}
+            self._soa_txns = txns
+            self._soa_types = np.fromiter((t['type'] for t in txns), np.int8, n)
+            self._soa_cats = np.fromiter(
+                (cat_index.setdefault(t['category'], len(cat_index)) for t in txns),
+                np.int16, n)
+            self._soa_cat_index = cat_index
+            self._soa_dates = np.array([t['date'] for t in txns])
+            self._soa_version = self.version
+        return (self._soa_txns, self._soa_types, self._soa_cats,
+                self._soa_cat_index, self._soa_dates)
     
     def set_budget(self, amount):
         """Set monthly budget"""
         try:
-            self.budget = Decimal(str(amount))
-            self.save_data()
+            self.budget = int(round(float(amount) * 100))
+            self._schedule_save()
             return True, "Budget set successfully"
         except Exception as e:
             return False, str(e)
@@ -207,28 +472,29 @@ class PersonalWallet:
         if self.budget == 0:
             return None
         
-        # Get current month expenses
+        # Current month expenses come straight out of the monthly aggregate
         current_month = datetime.now().strftime("%Y-%m")
-        month_expenses = sum(
-            Decimal(t['amount'].replace('$', '').replace('-', ''))
-            for t in self.transactions
-            if t['type'] == "Expense" and t['date'].startswith(current_month)
-        )
-        
-        remaining = self.budget - month_expenses
-        percentage = (month_expenses / self.budget * 100) if self.budget > 0 else 0
-        
+        spent_cents = int(round(self._monthly_exp.get(current_month, 0.0) * 100))
+
+        remaining_cents = self.budget - spent_cents
+        percentage = (spent_cents / self.budget * 100) if self.budget > 0 else 0
+
         return {
-            'budget': self.budget,
-            'spent': month_expenses,
-            'remaining': remaining,
+            'budget': self.budget / 100,
+            'spent': spent_cents / 100,
+            'remaining': remaining_cents / 100,
             'percentage': float(percentage)
         }
 
 
 class WalletGUI:
     """GUI for the Personal Wallet application"""
-    
+
+    # Rows materialized in the history tree per page-in step; Tk keeps
+    # every inserted row in Tcl memory, so the tree only ever holds the
+    # scrolled-to prefix instead of the whole wallet
+    TREE_CHUNK = 200
+
     def __init__(self, root):
         self.root = root
         self.root.title("Personal Wallet - Advanced Version")
@@ -236,8 +502,22 @@ class WalletGUI:
         self.root.resizable(True, True)
         
         self.wallet = PersonalWallet()
+        self.wallet.root = root
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        self._tree_version = None
+        self._tree_rows = []
+        self._tree_loaded = 0
+        self._dirty_tabs = set()
+        self._refresh_pending = None
+        # () is never a real render state, so the first update always runs
+        self._last_budget_render = ()
         self.setup_ui()
         self.refresh_all()
+
+    def on_close(self):
+        """Flush any pending save before the window goes away"""
+        self.wallet._flush()
+        self.root.destroy()
     
     def setup_ui(self):
         """Setup the user interface"""
@@ -261,6 +541,9 @@ class WalletGUI:
         self.setup_analytics_tab()
         self.setup_budget_tab()
         self.setup_search_tab()
+
+        # Hidden tabs are refreshed lazily when they become visible
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
     
     def setup_transactions_tab(self):
         """Setup the transactions tab"""
@@ -387,10 +670,12 @@ class WalletGUI:
         self.tree.heading("Description", text="Description")
         self.tree.heading("Date", text="Date")
         
-        # Add scrollbar
+        # Add scrollbar; yscroll runs through a hook that pages in more
+        # rows as the view approaches the bottom
         scrollbar = ttk.Scrollbar(hist_frame, orient=tk.VERTICAL, command=self.tree.yview)
-        self.tree.configure(yscroll=scrollbar.set)
-        
+        self._tree_scrollbar = scrollbar
+        self.tree.configure(yscroll=self._on_tree_yscroll)
+
         self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
@@ -416,19 +701,24 @@ class WalletGUI:
         """Add a transaction"""
         try:
             amount = self.amount_entry.get().strip()
-            category = self.category_var.get()
-            description = self.description_entry.get().strip()
-            
+
             if not amount:
                 messagebox.showwarning("Validation Error", "Please enter an amount")
                 return
-            
-            success, message = self.wallet.add_transaction(amount, trans_type, category, description)
+
+            if not _AMT_RE.match(amount):
+                messagebox.showwarning("Validation Error",
+                                       "Amount must be a positive number with at most two decimals")
+                return
+
+            success, message = self.wallet.add_transaction(
+                amount, trans_type, self.category_var.get(),
+                self.description_entry.get().strip())
             
             if success:
                 messagebox.showinfo("Success", message)
                 self.clear_form()
-                self.refresh_all()
+                self._schedule_refresh()
             else:
                 messagebox.showerror("Error", message)
         
@@ -509,6 +799,36 @@ class WalletGUI:
         # Create frame for charts
         self.charts_container = tk.Frame(charts_frame, bg='white')
         self.charts_container.pack(fill=tk.BOTH, expand=True)
+
+        if MATPLOTLIB_AVAILABLE:
+            # Build the Figure and Tk canvas once; refreshes only redraw
+            # the axes instead of recreating and re-embedding everything
+            # OO API: no pyplot figure manager, so nothing to leak or close
+            self._fig = Figure(figsize=(12, 5))
+            self._ax_pie, self._ax_bar = self._fig.subplots(1, 2)
+            self._fig.patch.set_facecolor('white')
+            # Blitting state: bar artists are animated so the static
+            # axes background can be restored and only the rects redrawn
+            self._income_bars = None
+            self._expense_bars = None
+            self._bar_bg = None
+            self._bar_months = None
+            self._pie_data = None
+            # Constant chart inputs, built once instead of per refresh
+            self._palette = ('#81c784', '#ffb74d', '#e57373', '#ba68c8',
+                             '#64b5f6', '#ffd54f', '#4dd0e1', '#aed581')
+            self._bar_offsets = {}  # month count -> (x, left, right)
+            self._canvas = FigureCanvasTkAgg(self._fig, master=self.charts_container)
+            self._canvas.mpl_connect('draw_event', self._redraw_bars)
+            self._canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        else:
+            msg = tk.Label(self.charts_container,
+                          text="📊 Charts not available\n\nMatplotlib is not installed.\n\nTo enable charts, install matplotlib:\npip install matplotlib",
+                          font=("Arial", 12),
+                          bg='white',
+                          fg='#666666',
+                          justify=tk.CENTER)
+            msg.pack(expand=True)
     
     def setup_budget_tab(self):
         """Setup the budget tab"""
@@ -563,6 +883,13 @@ class WalletGUI:
         
         self.alerts_text = tk.Text(alerts_frame, height=10, font=("Arial", 10), wrap=tk.WORD, bg='#f5f5f5')
         self.alerts_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+
+        # Tag properties never change, so configure them once here
+        self.alerts_text.tag_config('warning', foreground='#f44336', font=("Arial", 11, "bold"))
+        self.alerts_text.tag_config('notice', foreground='#ff9800', font=("Arial", 11, "bold"))
+        self.alerts_text.tag_config('success', foreground='#4caf50', font=("Arial", 11, "bold"))
+        # () is not a real bucket, so the first render always writes
+        self._last_alert_bucket = ()
     
     def setup_search_tab(self):
         """Setup the search tab"""
@@ -589,9 +916,8 @@ class WalletGUI:
         # Category filter
         tk.Label(filter_grid, text="Category:", font=("Arial", 10), bg='white').grid(row=0, column=2, sticky=tk.W, padx=10, pady=8)
         self.search_category_var = tk.StringVar(value="All")
-        all_categories = ["All"] + self.wallet.categories["income"] + self.wallet.categories["expense"]
         category_search_combo = ttk.Combobox(filter_grid, textvariable=self.search_category_var,
-                                            values=list(set(all_categories)), state="readonly", width=15, font=("Arial", 10))
+                                            values=self.wallet.all_categories_for_search, state="readonly", width=15, font=("Arial", 10))
         category_search_combo.grid(row=0, column=3, sticky=tk.W, padx=10, pady=8)
         
         # Search button
@@ -639,26 +965,93 @@ class WalletGUI:
         """Refresh the transactions display"""
         # Update balance
         self.balance_display.config(text=f"Current Balance: {self.wallet.get_balance()}")
-        
-        # Clear and update transaction tree
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
-        for trans in self.wallet.get_transactions():
-            self.tree.insert("", "end", values=(
-                trans['id'],
-                trans['amount'],
-                trans['type'],
-                trans['category'],
-                trans['description'],
-                trans['date']
-            ))
+
+        # Rebuild the tree only when the transaction list actually changed
+        if self._tree_version == self.wallet.version:
+            return
+        self._tree_version = self.wallet.version
+
+        # Materialize only the first window; scrolling pages in the rest
+        self._tree_rows = self.wallet.get_transactions()
+        self._tree_loaded = min(len(self._tree_rows), self.TREE_CHUNK)
+        self._diff_tree(self.tree, self._tree_rows[:self._tree_loaded])
+
+    def _on_tree_yscroll(self, first, last):
+        """Feed the scrollbar and page in more rows near the bottom"""
+        self._tree_scrollbar.set(first, last)
+        if float(last) > 0.9 and self._tree_loaded < len(self._tree_rows):
+            self._load_more_rows()
+
+    def _load_more_rows(self):
+        self._tree_loaded = min(self._tree_loaded + self.TREE_CHUNK,
+                                len(self._tree_rows))
+        self._diff_tree(self.tree, self._tree_rows[:self._tree_loaded])
+
+    @staticmethod
+    def _diff_tree(tree, transactions):
+        """Sync a Treeview to `transactions` (newest first) by diffing.
+
+        Rows are keyed by iid=str(transaction id), so one add or delete
+        costs a handful of Tk calls instead of a full clear-and-reinsert.
+        Transactions never mutate in place, so surviving rows need no
+        value updates.
+        """
+        desired_ids = {str(t['id']) for t in transactions}
+        stale = [iid for iid in tree.get_children('') if iid not in desired_ids]
+        if stale:
+            tree.delete(*stale)
+        existing = set(tree.get_children(''))
+        if not existing and transactions:
+            # Full repopulate: submit every insert as one generated Tcl
+            # script so the interpreter is entered once, not N times
+            w = str(tree)
+            script = '\n'.join(
+                '%s insert {} end -id %d -values [list %s]' % (
+                    w, t['id'], ' '.join(map(_tcl_quote, _row_values(t))))
+                for t in transactions)
+            tree.tk.eval(script)
+            return
+        insert = tree.insert
+        for i, t in enumerate(transactions):
+            iid = str(t['id'])
+            if iid not in existing:
+                insert('', i, iid=iid, values=_row_values(t))
     
+    def _schedule_refresh(self):
+        """Coalesce bursts of mutations into one refresh per 50 ms window"""
+        if self._refresh_pending is not None:
+            self.root.after_cancel(self._refresh_pending)
+        self._refresh_pending = self.root.after(50, self._do_refresh)
+
+    def _do_refresh(self):
+        self._refresh_pending = None
+        self.refresh_all()
+
     def refresh_all(self):
-        """Refresh all tabs"""
-        self.refresh_display()
-        self.update_analytics()
-        self.update_budget_display()
+        """Mark every tab stale and refresh only the visible one"""
+        # Chart and statistics redraws dwarf the cost of the mutation
+        # itself, so hidden tabs just get flagged for later
+        self._dirty_tabs = {'transactions', 'analytics', 'budget'}
+        self._refresh_current_tab()
+
+    def _on_tab_changed(self, event=None):
+        self._refresh_current_tab()
+
+    def _refresh_current_tab(self):
+        """Refresh the visible tab if it has pending changes"""
+        current = self.notebook.select()
+        if current == str(self.transactions_tab):
+            if 'transactions' in self._dirty_tabs:
+                self._dirty_tabs.discard('transactions')
+                self.refresh_display()
+        elif current == str(self.analytics_tab):
+            if 'analytics' in self._dirty_tabs:
+                self._dirty_tabs.discard('analytics')
+                self.update_analytics()
+        elif current == str(self.budget_tab):
+            if 'budget' in self._dirty_tabs:
+                self._dirty_tabs.discard('budget')
+                self.update_budget_display()
     
     def update_analytics(self):
         """Update analytics tab with charts and statistics"""
@@ -678,55 +1071,81 @@ class WalletGUI:
         except Exception as e:
             print(f"Error updating analytics: {str(e)}")
     
+    def _redraw_bars(self, event=None):
+        """Recapture the bar axes background and paint the animated bars.
+
+        Runs after every full canvas draw (including resizes) so the
+        blit background stays valid and the animated artists reappear.
+        """
+        if not self._income_bars:
+            return
+        ax2 = self._ax_bar
+        self._bar_bg = self._canvas.copy_from_bbox(ax2.bbox)
+        for rect in (*self._income_bars, *self._expense_bars):
+            ax2.draw_artist(rect)
+        self._canvas.blit(ax2.bbox)
+
     def update_charts(self):
         """Update pie chart and bar graph"""
         try:
-            # Clear existing charts
-            for widget in self.charts_container.winfo_children():
-                widget.destroy()
-            
             if not MATPLOTLIB_AVAILABLE:
-                # Show message if matplotlib is not installed
-                msg_frame = tk.Frame(self.charts_container, bg='white')
-                msg_frame.pack(fill=tk.BOTH, expand=True)
-                
-                msg = tk.Label(msg_frame, 
-                              text="📊 Charts not available\n\nMatplotlib is not installed.\n\nTo enable charts, install matplotlib:\npip install matplotlib",
-                              font=("Arial", 12),
-                              bg='white',
-                              fg='#666666',
-                              justify=tk.CENTER)
-                msg.pack(expand=True)
                 return
-            
-            # Create figure with subplots
-            fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 5))
-            fig.patch.set_facecolor('white')
-            
-            # Pie Chart - Expense Distribution by Category
+
             expense_data = self.wallet.get_expense_by_category()
+            monthly_data = self.wallet.get_monthly_data(6)
+            months = list(monthly_data.keys())
+            income = [monthly_data[m]['income'] for m in months]
+            expense = [monthly_data[m]['expense'] for m in months]
+
+            # Blit fast path: same wedges and month labels means only
+            # bar heights changed — restore the cached background and
+            # redraw just the rects instead of rasterizing both axes
+            if (self._bar_bg is not None and months == self._bar_months
+                    and expense_data == self._pie_data
+                    and max(income + expense, default=0.0) <= self._ax_bar.get_ylim()[1]):
+                canvas = self._canvas
+                ax2 = self._ax_bar
+                canvas.restore_region(self._bar_bg)
+                for rect, h in zip(self._income_bars, income):
+                    rect.set_height(h)
+                    ax2.draw_artist(rect)
+                for rect, h in zip(self._expense_bars, expense):
+                    rect.set_height(h)
+                    ax2.draw_artist(rect)
+                canvas.blit(ax2.bbox)
+                return
+
+            # Reuse the cached axes; clearing them is far cheaper than
+            # rebuilding the Figure and FigureCanvasTkAgg per refresh
+            ax1, ax2 = self._ax_pie, self._ax_bar
+            ax1.clear()
+            ax2.clear()
+            self._income_bars = None
+            self._expense_bars = None
+            self._bar_bg = None
+
+            # Pie Chart - Expense Distribution by Category
             if expense_data:
-                colors = ['#81c784', '#ffb74d', '#e57373', '#ba68c8', '#64b5f6', '#ffd54f', '#4dd0e1', '#aed581']
                 ax1.pie(expense_data.values(), labels=expense_data.keys(), autopct='%1.1f%%',
-                       startangle=90, colors=colors[:len(expense_data)])
+                       startangle=90, colors=self._palette[:len(expense_data)])
                 ax1.set_title('Expense Distribution by Category', fontsize=12, fontweight='bold')
             else:
                 ax1.text(0.5, 0.5, 'No expense data', ha='center', va='center', transform=ax1.transAxes)
                 ax1.set_title('Expense Distribution by Category', fontsize=12, fontweight='bold')
             
             # Bar Graph - Income vs Expense (Last 6 Months)
-            monthly_data = self.wallet.get_monthly_data(6)
             if monthly_data:
-                months = list(monthly_data.keys())
-                income = [monthly_data[m]['income'] for m in months]
-                expense = [monthly_data[m]['expense'] for m in months]
-                
-                x = range(len(months))
                 width = 0.35
-                
-                ax2.bar([i - width/2 for i in x], income, width, label='Income', color='#4caf50')
-                ax2.bar([i + width/2 for i in x], expense, width, label='Expense', color='#f44336')
-                
+                offsets = self._bar_offsets.get(len(months))
+                if offsets is None:
+                    x = list(range(len(months)))
+                    offsets = (x, [i - width/2 for i in x], [i + width/2 for i in x])
+                    self._bar_offsets[len(months)] = offsets
+                x, left, right = offsets
+
+                self._income_bars = ax2.bar(left, income, width, label='Income', color='#4caf50')
+                self._expense_bars = ax2.bar(right, expense, width, label='Expense', color='#f44336')
+
                 ax2.set_xlabel('Month', fontweight='bold')
                 ax2.set_ylabel('Amount ($)', fontweight='bold')
                 ax2.set_title('Income vs Expense (Last 6 Months)', fontsize=12, fontweight='bold')
@@ -738,13 +1157,18 @@ class WalletGUI:
                 ax2.text(0.5, 0.5, 'No monthly data', ha='center', va='center', transform=ax2.transAxes)
                 ax2.set_title('Income vs Expense (Last 6 Months)', fontsize=12, fontweight='bold')
             
-            plt.tight_layout()
-            
-            # Embed in tkinter
-            canvas = FigureCanvasTkAgg(fig, master=self.charts_container)
-            canvas.draw()
-            canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-            
+            self._fig.tight_layout()
+            self._bar_months = months if monthly_data else None
+            self._pie_data = dict(expense_data)
+            if self._income_bars is not None:
+                # Animated artists are skipped by full draws, letting the
+                # draw_event hook capture a bar-free background for blits
+                for rect in (*self._income_bars, *self._expense_bars):
+                    rect.set_animated(True)
+                self._canvas.draw()
+            else:
+                self._canvas.draw_idle()
+
         except Exception as e:
             print(f"Error updating charts: {str(e)}")
     
@@ -769,7 +1193,24 @@ class WalletGUI:
         """Update budget progress and alerts"""
         try:
             status = self.wallet.get_budget_status()
-            
+
+            if status:
+                if status['percentage'] >= 100:
+                    bucket = 'warning'
+                elif status['percentage'] >= 75:
+                    bucket = 'notice'
+                else:
+                    bucket = 'success'
+                cur = (status['budget'], status['spent'], status['percentage'], bucket)
+            else:
+                cur = None
+
+            # Every widget write below is a Tcl call; skip them all when
+            # nothing visible has changed since the last render
+            if cur == self._last_budget_render:
+                return
+            self._last_budget_render = cur
+
             if status:
                 # Update status label
                 self.budget_status_label.config(
@@ -780,25 +1221,24 @@ class WalletGUI:
                 self.budget_progress['value'] = min(status['percentage'], 100)
                 self.budget_percentage_label.config(text=f"{status['percentage']:.1f}%")
                 
-                # Update alerts
-                self.alerts_text.delete('1.0', tk.END)
-                
-                if status['percentage'] >= 100:
-                    self.alerts_text.insert('1.0', "⚠️ WARNING: You have exceeded your budget!\n\n", 'warning')
-                elif status['percentage'] >= 75:
-                    self.alerts_text.insert('1.0', "⚠️ NOTICE: You have used 75% of your budget\n\n", 'notice')
-                else:
-                    self.alerts_text.insert('1.0', "✅ Budget is on track\n\n", 'success')
-                
-                self.alerts_text.tag_config('warning', foreground='#f44336', font=("Arial", 11, "bold"))
-                self.alerts_text.tag_config('notice', foreground='#ff9800', font=("Arial", 11, "bold"))
-                self.alerts_text.tag_config('success', foreground='#4caf50', font=("Arial", 11, "bold"))
+                # Rewrite the alert only when its severity bucket changed
+                if bucket != self._last_alert_bucket:
+                    self._last_alert_bucket = bucket
+                    if bucket == 'warning':
+                        msg = "⚠️ WARNING: You have exceeded your budget!\n\n"
+                    elif bucket == 'notice':
+                        msg = "⚠️ NOTICE: You have used 75% of your budget\n\n"
+                    else:
+                        msg = "✅ Budget is on track\n\n"
+                    self.alerts_text.replace('1.0', tk.END, msg, bucket)
             else:
                 self.budget_status_label.config(text="No budget set")
                 self.budget_progress['value'] = 0
                 self.budget_percentage_label.config(text="0%")
-                self.alerts_text.delete('1.0', tk.END)
-                self.alerts_text.insert('1.0', "Set a monthly budget to track your spending")
+                if self._last_alert_bucket is not None:
+                    self._last_alert_bucket = None
+                    self.alerts_text.replace('1.0', tk.END,
+                                             "Set a monthly budget to track your spending")
                 
         except Exception as e:
             print(f"Error updating budget display: {str(e)}")
@@ -819,21 +1259,9 @@ class WalletGUI:
                 category=category_filter
             )
             
-            # Clear search results
-            for item in self.search_tree.get_children():
-                self.search_tree.delete(item)
-            
-            # Display results
-            for trans in results:
-                self.search_tree.insert("", "end", values=(
-                    trans['id'],
-                    trans['amount'],
-                    trans['type'],
-                    trans['category'],
-                    trans['description'],
-                    trans['date']
-                ))
-            
+            # Sync the results tree against the previous query's rows
+            self._diff_tree(self.search_tree, results)
+
             messagebox.showinfo("Search Complete", f"Found {len(results)} transaction(s)")
         except Exception as e:
             messagebox.showerror("Error", f"Search failed: {str(e)}")
@@ -853,26 +1281,28 @@ class WalletGUI:
             )
             
             if file_path:
-                with open(file_path, 'w', newline='', encoding='utf-8') as csvfile:
-                    writer = csv.writer(csvfile)
-                    
-                    # Write header
-                    writer.writerow(['ID', 'Amount', 'Type', 'Category', 'Description', 'Date'])
-                    
-                    # Write data
-                    for trans in self.wallet.get_transactions():
-                        writer.writerow([
-                            trans['id'],
-                            trans['amount'],
-                            trans['type'],
-                            trans['category'],
-                            trans['description'],
-                            trans['date']
-                        ])
-                
-                messagebox.showinfo("Success", f"Transactions exported to:\n{file_path}")
+                # Snapshot on the Tk thread, write on a worker so large
+                # exports don't freeze the UI
+                rows = list(self.wallet.iter_transaction_rows())
+                threading.Thread(target=self._write_csv,
+                                 args=(file_path, rows), daemon=True).start()
         except Exception as e:
             messagebox.showerror("Error", f"Failed to export: {str(e)}")
+
+    def _write_csv(self, file_path, rows):
+        """Write the export snapshot to disk off the Tk thread"""
+        try:
+            with open(file_path, 'w', newline='', encoding='utf-8',
+                      buffering=1 << 20) as csvfile:
+                writer = csv.writer(csvfile)
+                writer.writerow(['ID', 'Amount', 'Type', 'Category', 'Description', 'Date'])
+                writer.writerows(rows)
+        except Exception as e:
+            self.root.after(0, messagebox.showerror, "Error",
+                            f"Failed to export: {str(e)}")
+        else:
+            self.root.after(0, messagebox.showinfo, "Success",
+                            f"Transactions exported to:\n{file_path}")
     
     def on_right_click(self, event):
         """Handle right-click on transaction"""
@@ -895,7 +1325,7 @@ class WalletGUI:
                 success, message = self.wallet.delete_transaction(trans_id)
                 if success:
                     messagebox.showinfo("Success", message)
-                    self.refresh_all()
+                    self._schedule_refresh()
                 else:
                     messagebox.showerror("Error", message)
         except Exception as e:
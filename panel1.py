@@ -52,6 +52,13 @@ class TaskPanel(tk.Tk):
         mid = tk.Frame(self, padx=8)
         mid.pack(fill="both", expand=True)
 
+        # Python-side backing store; pushed to the listvariable in one
+        # Tcl call instead of per-item insert/delete round-trips
+        self._items = []
+        self._marked = []
+        # strftime result cached per minute; rapid Return-key adds reuse it
+        self._stamp_minute = None
+        self._stamp = ""
         self.list_var = tk.Variable(value=[])
         self.listbox = tk.Listbox(
             mid,
@@ -130,29 +137,45 @@ class TaskPanel(tk.Tk):
             messagebox.showinfo("Pick a category", "Please select a category (Home, Gym, College).")
             return
 
-        stamp = datetime.now().strftime("%Y-%m-%d %H:%M")  # e.g., 2025-10-12 14:37
-        label = f"[{cat}] {text}  —  {stamp}"
+        now = datetime.now()
+        minute = (now.year, now.month, now.day, now.hour, now.minute)
+        if minute != self._stamp_minute:
+            self._stamp_minute = minute
+            self._stamp = now.strftime("%Y-%m-%d %H:%M")  # e.g., 2025-10-12 14:37
+        label = f"[{cat}] {text}  —  {self._stamp}"
 
-        self.listbox.insert(tk.END, label)
+        self._items.append(label)
+        self._marked.append(False)
+        self.list_var.set(self._items)
         self.task_var.set("")
-        idx = self.listbox.size() - 1
-        self.listbox.itemconfig(idx, foreground="black")
+        self.listbox.itemconfig(len(self._items) - 1, foreground="black")
 
+    def _apply_colors(self):
+        # Item colors are keyed by index, so they must be restated after
+        # any bulk rewrite that shifts rows
+        itemconfig = self.listbox.itemconfig
+        for i, marked in enumerate(self._marked):
+            itemconfig(i, foreground="gray" if marked else "black")
 
     def delete_selected(self):
-        sel = list(self.listbox.curselection())
+        sel = set(self.listbox.curselection())
         if not sel:
             messagebox.showinfo("No selection", "Select one or more tasks to delete.")
             return
-        # Delete from bottom to top so indices don't shift
-        for idx in reversed(sel):
-            self.listbox.delete(idx)
+        # Rebuild the backing lists once and push them in a single call
+        # instead of one listbox.delete per selected row
+        self._items = [t for i, t in enumerate(self._items) if i not in sel]
+        self._marked = [m for i, m in enumerate(self._marked) if i not in sel]
+        self.list_var.set(self._items)
+        self._apply_colors()
 
     def clear_all(self):
-        if self.listbox.size() == 0:
+        if not self._items:
             return
         if messagebox.askyesno("Clear all", "Delete all tasks?"):
-            self.listbox.delete(0, tk.END)
+            self._items = []
+            self._marked = []
+            self.list_var.set([])
 
     def mark_one(self):
         sel = self.listbox.curselection()
@@ -164,23 +187,16 @@ class TaskPanel(tk.Tk):
             return
 
         idx = sel[0]
-        text = self.listbox.get(idx)
-
-        # Toggle marked state by prefix and color
-        if text.startswith("✓ "):
-            # unmark
-            new_text = text[2:]
-            self.listbox.delete(idx)
-            self.listbox.insert(idx, new_text)
-            self.listbox.itemconfig(idx, foreground="black")
-            self.listbox.selection_set(idx)
-        else:
-            # mark
-            new_text = "✓ " + text
-            self.listbox.delete(idx)
-            self.listbox.insert(idx, new_text)
-            self.listbox.itemconfig(idx, foreground="gray")
-            self.listbox.selection_set(idx)
+        text = self._items[idx]
+
+        # Toggle marked state by prefix and color; rewriting the list
+        # variable keeps the row in place without delete+insert shuffling
+        marked = not self._marked[idx]
+        self._items[idx] = "✓ " + text if marked else text[2:]
+        self._marked[idx] = marked
+        self.list_var.set(self._items)
+        self.listbox.itemconfig(idx, foreground="gray" if marked else "black")
+        self.listbox.selection_set(idx)
 
 if __name__ == "__main__":
     app = TaskPanel()
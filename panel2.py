@@ -1,20 +1,129 @@
 import tkinter as tk
 from tkinter import messagebox
 from tkinter import ttk
-from datetime import datetime
-import json, os
-
-CATEGORIES = ["Home", "Gym", "College"]
+import json, os, sys, threading, time
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = NUMPY_AVAILABLE
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Category/priority names are interned: every item and filter compare
+# then reduces to a pointer check and the strings exist once
+CATEGORIES = [sys.intern(c) for c in ("Home", "Gym", "College")]
 DATA_FILE = "tasks.json"
-PRIORITY_SYMBOLS = {
+PRIORITY_SYMBOLS = {sys.intern(k): v for k, v in {
     "Low": "◻",
     "Medium": "●",
     "High": "◯",
     "Urgent": "🔴",
+}.items()}
+# Indexed by the done flag (0/1) to skip per-row branching
+STATUS_SYMBOLS = ("⏳", "✅")
+DONE_TAGS = ("done",)
+ACTIVE_TAGS = ("active",)
+# All 2x4 (done, priority) row stylings precomputed; the insert loop
+# does one dict lookup instead of building icons and tags per row
+_ROW_STYLE = {
+    (done, pr): (STATUS_SYMBOLS[done], sym, DONE_TAGS if done else ACTIVE_TAGS)
+    for done in (0, 1) for pr, sym in PRIORITY_SYMBOLS.items()
 }
 
+# Parsed-task cache keyed by file mtime; warm loads (e.g. a second
+# TaskPanel in the same process) skip the JSON parse entirely
+_TASKS_CACHE = {"mtime": None, "data": None}
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _filter_mask(cat_codes, done, cat_target, status_target):
+        # -1 means "no filter" for either target; compiled to a tight
+        # machine-code loop over the int8 arrays
+        n = cat_codes.shape[0]
+        mask = np.empty(n, np.bool_)
+        for i in range(n):
+            ok = True
+            if cat_target != -1 and cat_codes[i] != cat_target:
+                ok = False
+            elif status_target != -1 and done[i] != status_target:
+                ok = False
+            mask[i] = ok
+        return mask
+elif NUMPY_AVAILABLE:
+    def _filter_mask(cat_codes, done, cat_target, status_target):
+        mask = np.ones(cat_codes.shape[0], np.bool_)
+        if cat_target != -1:
+            mask &= cat_codes == cat_target
+        if status_target != -1:
+            mask &= done == status_target
+        return mask
+
+
+def _row_style(it):
+    """(status icon, priority icon, tags) for an item, from the table."""
+    style = _ROW_STYLE.get((it["done"], it["priority"]))
+    if style is None:  # unknown priority string from an edited file
+        style = (STATUS_SYMBOLS[it["done"]], "●",
+                 DONE_TAGS if it["done"] else ACTIVE_TAGS)
+    return style
+
+
+# Timestamp labels only carry minute resolution, so strftime runs at
+# most once per minute no matter how fast tasks are added
+_last_stamp = [0, ""]
+
+
+def _now_stamp():
+    t = int(time.time() // 60)
+    if t != _last_stamp[0]:
+        from datetime import datetime
+        _last_stamp[0] = t
+        _last_stamp[1] = datetime.now().strftime("%Y-%m-%d %H:%M")
+    return _last_stamp[1]
+
+
+def _make_matcher(q):
+    """Build a hay -> bool predicate for a multi-term (whitespace-split)
+    query, matching when any term occurs. Uses an Aho-Corasick automaton
+    when available so all terms are found in one scan of the haystack."""
+    terms = q.split()
+    if AHOCORASICK_AVAILABLE:
+        ac = ahocorasick.Automaton()
+        for t in terms:
+            ac.add_word(t, t)
+        ac.make_automaton()
+
+        def match(hay, _iter=ac.iter):
+            for _ in _iter(hay):
+                return True
+            return False
+        return match
+    return lambda hay: any(t in hay for t in terms)
+
 
 class TaskPanel(tk.Tk):
+    # Item count at which filtering switches to the array-mask path
+    SOA_THRESHOLD = 1024
+
     def __init__(self):
         super().__init__()
         self.title("Task Panel")
@@ -22,15 +131,31 @@ class TaskPanel(tk.Tk):
         self.minsize(640, 620)
         self.configure(bg="#f3f4f6")
 
-        # Structured storage
-        self.tasks_data = {c: [] for c in CATEGORIES}
-
-        # Master list for Treeview rows
-        # item = {"id": int, "cat": str, "priority": str, "task": str, "time": str, "done": bool}
-        self.items = []
+        # Master store for Treeview rows, keyed by id (insertion-ordered)
+        # and the single source of truth for task data
+        # item = {"id": int, "cat": str, "priority": str, "task": str, "time": str, "done": 0|1}
+        self.items = {}
         self._next_id = 1
 
-        # Tree row metadata map: iid -> json string of task
+        # Running counters for the status bar; accumulated during the
+        # rebuild pass so update_stats only formats the label
+        self._visible_total = 0
+        self._visible_completed = 0
+
+        # Pending after() id for the debounced search rebuild
+        self._filter_after_id = None
+
+        # Debounced persistence: mutations mark dirty and one write
+        # fires per burst instead of one per click
+        self._dirty = False
+        self._save_after_id = None
+
+        # Mutation counter invalidating the cached filter arrays below
+        self._version = 0
+        self._soa_version = None
+
+        # Tree row metadata map: iid -> task dict (shared with self.items,
+        # so stats read fields directly and serialization happens only at save)
         self.metas = {}
 
         # ===== Header + Search + Filters + Treeview =====
@@ -109,6 +234,9 @@ class TaskPanel(tk.Tk):
         self.bind("<Delete>", lambda _e: self.delete_selected())
         self.entry.focus_set()
 
+        # Flush any pending save before the window goes away
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+
         # Load persisted tasks (if any)
         self.load_tasks()
 
@@ -136,7 +264,7 @@ class TaskPanel(tk.Tk):
             font=('Arial', 10), width=22, bd=1, relief='solid'
         )
         self.search_entry.grid(row=0, column=1, padx=5)
-        self.search_entry.bind('<KeyRelease>', self.filter_tasks)
+        self.search_entry.bind('<KeyRelease>', self._debounced_filter)
 
         tk.Label(search_frame, text="Status:", font=('Arial', 10, 'bold'), bg='#f8f9fa')\
             .grid(row=0, column=2, padx=(16, 5), sticky='e')
@@ -207,7 +335,7 @@ class TaskPanel(tk.Tk):
 
     # ==================== Helpers & filtering ====================
     def _status_emoji(self, done: bool) -> str:
-        return "✅" if done else "⏳"
+        return STATUS_SYMBOLS[done]
 
     def _priority_emoji(self, pr: str) -> str:
         return PRIORITY_SYMBOLS.get(pr, "●")  # پیش‌فرض: ●
@@ -226,13 +354,27 @@ class TaskPanel(tk.Tk):
         )
         iid = self.tree.insert('', 'end', values=values,
                             tags=("done",) if task.get("done") else ("active",))
-        self.metas[str(iid)] = json.dumps(task)
-
-
-    def _passes_filters(self, item):
-        q = self.search_var.get().strip().lower()
-        cat_filter = self.category_filter_var.get()
-        status_filter = self.filter_var.get()
+        # Normalize to the item schema so metas stay uniform for stats/save
+        self.metas[str(iid)] = {
+            "id": task.get("id"),
+            "cat": task.get("category", "General"),
+            "priority": task.get("priority", "Medium"),
+            "task": task["text"],
+            "time": task["created"],
+            "done": bool(task.get("done", False)),
+        }
+
+
+    def _passes_filters(self, item, q=None, cat_filter=None, status_filter=None, matcher=None):
+        # Callers checking a single item leave the filters None and the
+        # current widget values are read here; _rebuild_tree hoists them
+        # once and passes them in so the loop does no StringVar reads
+        if q is None:
+            q = self.search_var.get().strip().lower()
+        if cat_filter is None:
+            cat_filter = self.category_filter_var.get()
+        if status_filter is None:
+            status_filter = self.filter_var.get()
 
         if cat_filter != "All" and item["cat"] != cat_filter:
             return False
@@ -241,58 +383,160 @@ class TaskPanel(tk.Tk):
         if status_filter != "All" and status_filter != status_label:
             return False
 
+        # _hay is precomputed at item creation, not rebuilt per keystroke;
+        # single-term queries take the plain substring fast path
         if q:
-            hay = f'{item["task"]} {item["cat"]} {item["priority"]} {item["time"]}'.lower()
-            if q not in hay:
+            hay = item["_hay"]
+            if matcher is not None:
+                if not matcher(hay):
+                    return False
+            elif " " in q:
+                if not _make_matcher(q)(hay):
+                    return False
+            elif q not in hay:
                 return False
         return True
 
+    def _by_category(self, cat):
+        # Lazy per-category view; replaces the old duplicated tasks_data
+        return [it for it in self.items.values() if it["cat"] == cat]
+
     def filter_tasks(self, event=None):
         self._rebuild_tree()  # rebuild also updates live stats
 
+    def _debounced_filter(self, event=None):
+        # Collapse bursts of keystrokes into one rebuild; combobox
+        # filters stay immediate since they fire once per selection
+        if self._filter_after_id is not None:
+            self.after_cancel(self._filter_after_id)
+        self._filter_after_id = self.after(150, self._run_filter)
+
+    def _run_filter(self):
+        self._filter_after_id = None
+        self._rebuild_tree()
+
+    def _filter_arrays(self):
+        # SoA mirror of self.items (category codes + done flags as int8
+        # arrays), rebuilt lazily when the mutation counter moves
+        if self._soa_version != self._version:
+            ordered = list(self.items.values())
+            index = {c: i for i, c in enumerate(CATEGORIES)}
+            codes = np.empty(len(ordered), np.int8)
+            done = np.empty(len(ordered), np.int8)
+            for i, it in enumerate(ordered):
+                code = index.get(it["cat"])
+                if code is None:
+                    code = len(index)
+                    index[it["cat"]] = code
+                codes[i] = code
+                done[i] = it["done"]
+            self._soa_items = ordered
+            self._soa_cat_codes = codes
+            self._soa_done = done
+            self._soa_cat_index = index
+            self._soa_version = self._version
+        return self._soa_cat_codes, self._soa_done, self._soa_items
+
     def _rebuild_tree(self):
-        # Clear rows & metas
-        self.tree.delete(*self.tree.get_children())
-        self.metas.clear()
+        # Detach every attached row instead of deleting it; existing
+        # nodes (and their Tcl cell values) are reused across rebuilds
+        tree = self.tree
+        children = tree.get_children()
+        if children:
+            tree.detach(*children)
+
+        # Hoist filter values once; the loop only touches plain locals
+        q = self.search_var.get().strip().lower()
+        cat_filter = self.category_filter_var.get()
+        status_filter = self.filter_var.get()
+        # Multi-term queries get one matcher for the whole rebuild
+        matcher = _make_matcher(q) if " " in q else None
 
-        # Reinsert rows that pass filters
-        for it in self.items:
-            if not self._passes_filters(it):
-                continue
-            status_ico = self._status_emoji(it["done"])
-            priority_ico = self._priority_emoji(it["priority"])
-            tags = ("done",) if it["done"] else ("active",)
-            iid = str(it["id"])
-            self.tree.insert(
-                "", tk.END, iid=iid,
-                values=(status_ico, priority_ico, it["cat"], it["task"], it["time"]),
-                tags=tags
-            )
-            # Keep JSON snapshot for stats/save
-            self.metas[iid] = json.dumps({
-                "id": it["id"],
-                "category": it["cat"],
-                "priority": it["priority"],
-                "text": it["task"],
-                "created": it["time"],
-                "done": it["done"]
-            })
+        # Hide the columns while bulk-reattaching so Tk skips cell
+        # layout per row; one restore at the end triggers a single redraw
+        tree.configure(displaycolumns=())
+        try:
+            exists = tree.exists
+            move = tree.move
+            # Reattach rows that pass filters; the default state (no search
+            # text, both filters "All") skips the predicate entirely
+            visible = completed = 0
+            if not q and cat_filter == "All" and status_filter == "All":
+                for it in self.items.values():
+                    completed += it["done"]
+                    iid = str(it["id"])
+                    if exists(iid):
+                        move(iid, '', tk.END)
+                    else:
+                        self._insert_row(it)
+                visible = len(self.items)
+            elif (NUMPY_AVAILABLE and not q
+                    and len(self.items) >= self.SOA_THRESHOLD):
+                # Large lists with only combobox filters: evaluate the
+                # whole predicate as one mask over int8 arrays
+                cat_codes, done, ordered = self._filter_arrays()
+                if cat_filter == "All":
+                    cat_target = -1
+                else:
+                    # -2 matches no category code (unknown filter value)
+                    cat_target = self._soa_cat_index.get(cat_filter, -2)
+                if status_filter == "All":
+                    status_target = -1
+                else:
+                    status_target = 1 if status_filter == "Completed" else 0
+                mask = _filter_mask(cat_codes, done, cat_target, status_target)
+                for i in np.nonzero(mask)[0]:
+                    it = ordered[i]
+                    visible += 1
+                    completed += it["done"]
+                    iid = str(it["id"])
+                    if exists(iid):
+                        move(iid, '', tk.END)
+                    else:
+                        self._insert_row(it)
+            else:
+                for it in self.items.values():
+                    if not self._passes_filters(it, q, cat_filter, status_filter, matcher):
+                        continue
+                    visible += 1
+                    completed += it["done"]
+                    iid = str(it["id"])
+                    if exists(iid):
+                        move(iid, '', tk.END)
+                    else:
+                        self._insert_row(it)
+        finally:
+            tree.configure(displaycolumns='#all')
 
         # Live stats after every UI rebuild
+        self._visible_total = visible
+        self._visible_completed = completed
         self.update_stats()
 
+    def _insert_row(self, it):
+        # Single-row insert shared by the rebuild loop and add_task;
+        # the precomputed style table avoids per-row icon/tag building
+        iid = str(it["id"])
+        status_ico, priority_ico, tags = _row_style(it)
+        self.tree.insert(
+            "", tk.END, iid=iid,
+            values=(status_ico, priority_ico, it["cat"], it["task"], it["time"]),
+            tags=tags
+        )
+        # Share the item dict for stats/save; no snapshot copy needed
+        self.metas[iid] = it
+
     # ============== Phase 6: Statistics & Persistence ==============
     def show_stats(self):
         """Display comprehensive statistics in a dialog."""
         total = len(self.metas)
-        completed = sum(1 for meta in self.metas.values() if json.loads(meta).get('done', False))
+        completed = sum(1 for meta in self.metas.values() if meta["done"])
         pending = total - completed
 
         # Category counts
         category_stats = {}
         for meta in self.metas.values():
-            data = json.loads(meta)
-            cat = data.get('category', 'General')
+            cat = meta["cat"]
             category_stats[cat] = category_stats.get(cat, 0) + 1
 
         stats_text = "📊 Statistics:\n"
@@ -306,59 +550,116 @@ class TaskPanel(tk.Tk):
         stats_text += f"📁 Categories: {cats_line}"
         messagebox.showinfo("Detailed Statistics", stats_text)
 
+    def _schedule_save(self):
+        """Mark state dirty and batch the disk write behind a 500 ms timer."""
+        self._dirty = True
+        if self._save_after_id is not None:
+            self.after_cancel(self._save_after_id)
+        self._save_after_id = self.after(500, self._flush_save)
+
+    def _flush_save(self):
+        self._save_after_id = None
+        if self._dirty:
+            self.save_tasks()
+
+    def _on_close(self):
+        if self._save_after_id is not None:
+            self.after_cancel(self._save_after_id)
+        if self._dirty:
+            self.save_tasks()
+        self.destroy()
+
     def save_tasks(self):
-        """Save tasks to JSON file (error-safe)."""
+        """Save tasks to JSON file (error-safe, atomic via tmp + rename)."""
+        self._dirty = False
         try:
-            tasks = []
-            for item_id in self.tree.get_children():
-                if item_id in self.metas:
-                    tasks.append(json.loads(self.metas[item_id]))
-            with open(DATA_FILE, "w", encoding="utf-8") as f:
-                json.dump(tasks, f, ensure_ascii=False, indent=2)
+            # items is the source of truth: every task is persisted even
+            # while a filter is hiding some rows
+            tasks = [{
+                "category": it["cat"],
+                "priority": it["priority"],
+                "text": it["task"],
+                "created": it["time"],
+                "done": bool(it["done"]),
+            } for it in self.items.values()]
+            tmp = DATA_FILE + ".tmp"
+            if ORJSON_AVAILABLE:
+                with open(tmp, "wb") as f:
+                    f.write(orjson.dumps(tasks, option=orjson.OPT_INDENT_2))
+            else:
+                with open(tmp, "w", encoding="utf-8") as f:
+                    json.dump(tasks, f, ensure_ascii=False, indent=2)
+            os.replace(tmp, DATA_FILE)
+            # Keep the read-through cache warm for the next load
+            _TASKS_CACHE["mtime"] = os.stat(DATA_FILE).st_mtime_ns
+            _TASKS_CACHE["data"] = tasks
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save tasks: {e}")
 
     def load_tasks(self):
-        """Load tasks from JSON file at startup, if present."""
-        if not os.path.exists(DATA_FILE):
-            self._rebuild_tree()
+        """Load tasks from JSON file at startup without blocking the UI."""
+        # Render the empty tree immediately; the parse happens off-thread
+        self._rebuild_tree()
+        threading.Thread(target=self._load_worker, daemon=True).start()
+
+    def _load_worker(self):
+        # Runs off the Tk thread: file IO + JSON parse + item dict
+        # construction. Results are marshalled back via after(0, ...).
+        try:
+            st = os.stat(DATA_FILE)
+        except OSError:
             return
         try:
-            with open(DATA_FILE, "r", encoding="utf-8") as f:
-                tasks = json.load(f)
-            # Rebuild internal structures
-            self.items.clear()
-            self._next_id = 1
+            if _TASKS_CACHE["mtime"] == st.st_mtime_ns and _TASKS_CACHE["data"] is not None:
+                tasks = _TASKS_CACHE["data"]
+            else:
+                if ORJSON_AVAILABLE:
+                    with open(DATA_FILE, "rb") as f:
+                        tasks = orjson.loads(f.read())
+                else:
+                    with open(DATA_FILE, "r", encoding="utf-8") as f:
+                        tasks = json.load(f)
+                _TASKS_CACHE["mtime"] = st.st_mtime_ns
+                _TASKS_CACHE["data"] = tasks
+            fallback_stamp = _now_stamp()
+            items = []
             for t in tasks:
                 item = {
-                    "id": self._next_id,
-                    "cat": t.get("category", "General"),
-                    "priority": t.get("priority", "Medium"),
+                    "id": 0,  # assigned on the Tk thread
+                    "cat": sys.intern(t.get("category", "General")),
+                    "priority": sys.intern(t.get("priority", "Medium")),
                     "task": t.get("text", ""),
-                    "time": t.get("created", datetime.now().strftime("%Y-%m-%d %H:%M")),
-                    "done": bool(t.get("done", False)),
+                    "time": t.get("created", fallback_stamp),
+                    "done": 1 if t.get("done", False) else 0,
                 }
-                self.items.append(item)
-                # structured store (optional but kept consistent)
-                cat = item["cat"]
-                if cat not in self.tasks_data:
-                    self.tasks_data[cat] = []
-                self.tasks_data[cat].append({
-                    "task": item["task"],
-                    "timestamp": item["time"],
-                    "done": item["done"],
-                    "priority": item["priority"],
-                })
-                self._next_id += 1
-            self._rebuild_tree()
+                item["_hay"] = f'{item["task"]} {item["cat"]} {item["priority"]} {item["time"]}'.lower()
+                items.append(item)
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to load tasks: {e}")
-            self._rebuild_tree()
+            self.after(0, messagebox.showerror, "Error", f"Failed to load tasks: {e}")
+            return
+        self.after(0, self._apply_loaded_items, items)
+
+    def _apply_loaded_items(self, items):
+        # Back on the Tk thread: ids are handed out here so tasks added
+        # while the load was in flight cannot collide
+        self.items.clear()
+        # Ids restart from 1, so drop any rows materialized before the
+        # load finished rather than letting them alias reused iids
+        if self.metas:
+            self.tree.delete(*self.metas)
+            self.metas.clear()
+        self._next_id = 1
+        for item in items:
+            item["id"] = self._next_id
+            self.items[item["id"]] = item
+            self._next_id += 1
+        self._version += 1
+        self._rebuild_tree()
 
     def update_stats(self):
         """Update status-bar with live totals."""
-        total = len(self.metas)
-        completed = sum(1 for meta in self.metas.values() if json.loads(meta).get('done', False))
+        total = self._visible_total
+        completed = self._visible_completed
         pending = total - completed
         self.stats_label.config(text=f"📊 Tasks: {completed} Completed | {pending} Pending | {total} Total")
 
@@ -375,16 +676,23 @@ class TaskPanel(tk.Tk):
             messagebox.showinfo("Pick a category", "Please select a category.")
             return
 
-        stamp = datetime.now().strftime("%Y-%m-%d %H:%M")
-        item = {"id": self._next_id, "cat": cat, "priority": pr, "task": text, "time": stamp, "done": False}
+        cat = sys.intern(cat)
+        pr = sys.intern(pr)
+        stamp = _now_stamp()
+        item = {"id": self._next_id, "cat": cat, "priority": pr, "task": text, "time": stamp, "done": 0,
+                "_hay": f"{text} {cat} {pr} {stamp}".lower()}
         self._next_id += 1
 
-        self.tasks_data.setdefault(cat, []).append({"task": text, "timestamp": stamp, "done": False, "priority": pr})
-        self.items.append(item)
+        self.items[item["id"]] = item
+        self._version += 1
 
         self.task_var.set("")
-        self._rebuild_tree()
-        self.save_tasks()
+        # New row appends at the end; no need to rebuild the whole tree
+        if self._passes_filters(item):
+            self._insert_row(item)
+            self._visible_total += 1
+            self.update_stats()
+        self._schedule_save()
 
     def delete_selected(self):
         sel = self.tree.selection()
@@ -392,25 +700,34 @@ class TaskPanel(tk.Tk):
             messagebox.showinfo("No selection", "Select one or more tasks to delete.")
             return
 
-        ids_to_remove = set(int(i) for i in sel)
-        removed = [it for it in self.items if it["id"] in ids_to_remove]
-        self.items = [it for it in self.items if it["id"] not in ids_to_remove]
-
-        for it in removed:
-            self.tasks_data[it["cat"]] = [d for d in self.tasks_data[it["cat"]] if d["task"] != it["task"]]
+        # O(selection) removal: pop by id. Rows must be deleted here
+        # since rebuilds now reuse nodes.
+        for iid in sel:
+            it = self.items.pop(int(iid), None)
+            self.metas.pop(iid, None)
+            if it is None:
+                continue
+            self._visible_total -= 1
+            self._visible_completed -= it["done"]
+        self.tree.delete(*sel)
+        self._version += 1
 
-        self._rebuild_tree()
-        self.save_tasks()
+        self.update_stats()
+        self._schedule_save()
 
     def clear_all(self):
         if not self.items:
             return
         if messagebox.askyesno("Clear all", "Delete all tasks?"):
             self.items.clear()
-            for cat in self.tasks_data:
-                self.tasks_data[cat].clear()
-            self._rebuild_tree()
-            self.save_tasks()
+            # Drop every materialized row, attached or detached
+            if self.metas:
+                self.tree.delete(*self.metas)
+                self.metas.clear()
+            self._visible_total = self._visible_completed = 0
+            self._version += 1
+            self.update_stats()
+            self._schedule_save()
 
     def mark_one(self):
         sel = self.tree.selection()
@@ -421,18 +738,25 @@ class TaskPanel(tk.Tk):
             messagebox.showinfo("Multiple selected", "Please select only one task to mark/unmark.")
             return
 
-        iid = int(sel[0])
-        for it in self.items:
-            if it["id"] == iid:
-                it["done"] = not it["done"]
-                # also flip in structured storage
-                for d in self.tasks_data.setdefault(it["cat"], []):
-                    if d["task"] == it["task"]:
-                        d["done"] = it["done"]
-                        break
-                break
-        self._rebuild_tree()
-        self.save_tasks()
+        it = self.items.get(int(sel[0]))
+        if it is not None:
+            it["done"] = 0 if it["done"] else 1
+            self._version += 1
+            # Always rewrite the row in place so a later reattach never
+            # shows a stale status icon
+            status_ico, priority_ico, tags = _row_style(it)
+            self.tree.item(
+                sel[0],
+                values=(status_ico, priority_ico, it["cat"], it["task"], it["time"]),
+                tags=tags
+            )
+            if self._passes_filters(it):
+                self._visible_completed += 1 if it["done"] else -1
+                self.update_stats()
+            else:
+                # Toggling pushed it outside the status filter
+                self._rebuild_tree()
+        self._schedule_save()
 
 if __name__ == "__main__":
     app = TaskPanel()